@@ -1,33 +1,3 @@
-from __future__ import annotations
-
-from typing import Dict, Optional, Tuple
-
-from cognition.normalize import normalize_text, remove_tokens, tokenize
-from memory.preferences import get_preference
-
-"""
-DAY 4 EXTENSION — LEARN PREFERENCE INTENT
-
-Add support for a new intent: LEARN_PREFERENCE
-
-Trigger patterns:
-- "use <app> as my <category>"
-- "set my <category> to <app>"
-
-Examples:
-Input: "use firefox as my browser"
-Output: ("LEARN_PREFERENCE", {"category": "browser", "app": "firefox"})
-
-Input: "use vscode as my editor"
-Output: ("LEARN_PREFERENCE", {"category": "editor", "app": "code"})
-
-Rules:
-- Reuse normalization utilities
-- Do not break OPEN_APP intent
-- Deterministic logic only
-- Never throw exceptions
-"""
-
 """
 PROJECT: APRIL
 
@@ -55,7 +25,7 @@ Input: "open chrome please"
 Output: ("OPEN_APP", {"app": "chrome"})
 
 Input: "can you launch code for me"
-Output: ("LEARN_PREFERENCE", {"category": "editor", "app": "code"})
+Output: ("OPEN_APP", {"app": "code"})
 
 Input: "hello april"
 Output: (None, {})
@@ -76,12 +46,46 @@ STYLE:
 Do not import skills.
 Do not execute anything.
 This module only understands intent.
+
+DAY 4 EXTENSION — LEARN PREFERENCE INTENT
+
+Add support for a new intent: LEARN_PREFERENCE
+
+Trigger patterns:
+- "use <app> as my <category>"
+- "set my <category> to <app>"
+
+Examples:
+Input: "use firefox as my browser"
+Output: ("LEARN_PREFERENCE", {"category": "browser", "app": "firefox"})
+
+Input: "use vscode as my editor"
+Output: ("LEARN_PREFERENCE", {"category": "editor", "app": "vscode"})
+
+Rules:
+- Reuse normalization utilities
+- Do not break OPEN_APP intent
+- Deterministic logic only
+- Never throw exceptions
 """
 
+from __future__ import annotations
+
+import re
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+from cognition.normalize import build_removal_set, normalize_and_tokenize, remove_tokens
+from memory.preferences import get_preference, preferences_version
+
 IntentResult = Tuple[Optional[str], Dict[str, str]]
 
-_OPEN_VERBS: Tuple[str, ...] = ("open", "launch", "start")
-_LEARN_VERBS: Tuple[str, ...] = ("use", "set")
+# Shared by every non-matching parse; like all results it is read-only
+_EMPTY_RESULT: IntentResult = (None, {})
+
+_OPEN_VERBS: FrozenSet[str] = frozenset(("open", "launch", "start"))
+_LEARN_VERBS: FrozenSet[str] = frozenset(("use", "set"))
 _DANGEROUS_KEYWORDS: Tuple[str, ...] = (
 	"delete",
 	"remove",
@@ -94,6 +98,8 @@ _DANGEROUS_KEYWORDS: Tuple[str, ...] = (
 	"wipe",
 	"erase",
 )
+# One alternation scans the text once instead of once per keyword.
+_DANGER_RE = re.compile("|".join(re.escape(keyword) for keyword in _DANGEROUS_KEYWORDS))
 _FILLER_WORDS: Tuple[str, ...] = (
 	"please",
 	"can",
@@ -105,16 +111,15 @@ _FILLER_WORDS: Tuple[str, ...] = (
 	"would",
 	"mind",
 )
+_FILLER_SET: FrozenSet[str] = build_removal_set(_FILLER_WORDS)
 
 def _detect_dangerous_action(raw_text: str) -> Optional[IntentResult]:
 	"""Detect commands with dangerous keywords for confirmation."""
 	if not raw_text:
 		return None
 	
-	text_lower = raw_text.lower()
-	for keyword in _DANGEROUS_KEYWORDS:
-		if keyword in text_lower:
-			return "DANGEROUS_ACTION", {"raw": raw_text}
+	if _DANGER_RE.search(raw_text.lower()):
+		return "DANGEROUS_ACTION", {"raw": raw_text}
 	
 	return None
 
@@ -128,50 +133,39 @@ def _detect_learn_preference(tokens: Tuple[str, ...]) -> Optional[IntentResult]:
 	if verb not in _LEARN_VERBS:
 		return None
 
+	# "use <app> as ..." splits on "as"; "set ... to <app>" splits on "to"
+	split_word = "as" if verb == "use" else "to"
+	try:
+		split_index = tokens.index(split_word, 1)
+	except ValueError:
+		return None
+
+	if split_index < 2:  # Need at least "use <app> as" / "set <category> to"
+		return None
+
 	if verb == "use":
-		# Find "as" keyword to split app name from category
-		try:
-			as_index = tokens.index("as")
-		except ValueError:
-			return None
-		
-		if as_index < 2:  # Need at least "use <app> as"
-			return None
-			
-		app_tokens = tokens[1:as_index]
-		app_name = " ".join(app_tokens)
+		app_name = " ".join(tokens[1:split_index])
 		
 		# Pattern: "use <app> as my <category>"
-		if as_index + 2 < len(tokens) and tokens[as_index + 1] == "my":
-			category = tokens[as_index + 2]
+		if split_index + 2 < len(tokens) and tokens[split_index + 1] == "my":
+			category = tokens[split_index + 2]
 			return "LEARN_PREFERENCE", {"category": category, "app": app_name}
 		# Pattern: "use <app> as <category>"
-		elif as_index + 1 < len(tokens):
-			category = tokens[as_index + 1]
+		elif split_index + 1 < len(tokens):
+			category = tokens[split_index + 1]
 			return "LEARN_PREFERENCE", {"category": category, "app": app_name}
 			
-	elif verb == "set":
-		# Find "to" keyword to split category from app name
-		try:
-			to_index = tokens.index("to")
-		except ValueError:
-			return None
-			
-		if to_index < 2:  # Need at least "set <category> to"
-			return None
-			
+	else:
 		# Pattern: "set my <category> to <app>"
-		if tokens[1] == "my" and to_index == 3:
+		if tokens[1] == "my" and split_index == 3:
 			category = tokens[2]
-			app_tokens = tokens[to_index + 1:]
-			app_name = " ".join(app_tokens)
-			return "LEARN_PREFERENCE", {"category": category, "app": app_name}
 		# Pattern: "set <category> to <app>"
-		elif to_index == 2:
+		elif split_index == 2:
 			category = tokens[1]
-			app_tokens = tokens[to_index + 1:]
-			app_name = " ".join(app_tokens)
-			return "LEARN_PREFERENCE", {"category": category, "app": app_name}
+		else:
+			return None
+		app_name = " ".join(tokens[split_index + 1:])
+		return "LEARN_PREFERENCE", {"category": category, "app": app_name}
 
 	return None
 
@@ -191,13 +185,14 @@ def _detect_open_app(tokens: Tuple[str, ...]) -> Optional[IntentResult]:
 
 	# Handle "my category" patterns
 	if remainder[0] == "my" and len(remainder) > 1:
-		category = remainder[1]
+		category = sys.intern(remainder[1])
 		app_name = get_preference(category)
 		if app_name:
 			return "OPEN_APP", {"app": app_name, "category": category}
 
 	# Handle direct category lookup
-	app_token = remainder[0]
+	# App and category names repeat across commands; interned copies are shared
+	app_token = sys.intern(remainder[0])
 	if not app_token:
 		return None
 
@@ -210,33 +205,45 @@ def _detect_open_app(tokens: Tuple[str, ...]) -> Optional[IntentResult]:
 	return "OPEN_APP", {"app": app_token}
 
 
+_VERB_DISPATCH: Dict[str, Callable[[Tuple[str, ...]], Optional[IntentResult]]] = {}
+for _verb in _LEARN_VERBS:
+	_VERB_DISPATCH[_verb] = _detect_learn_preference
+for _verb in _OPEN_VERBS:
+	_VERB_DISPATCH[_verb] = _detect_open_app
+del _verb
+
+
 def parse_intent(raw_text: str) -> IntentResult:
-	"""Convert free-form text into intent classification and payload."""
-	normalized = normalize_text(raw_text)
-	if not normalized:
-		return None, {}
+	"""Convert free-form text into intent classification and payload.
+
+	Results are cached and shared between calls; treat payloads as read-only.
+	"""
+	if not isinstance(raw_text, str):
+		return _EMPTY_RESULT
+	return _parse_intent_cached(raw_text, preferences_version())
 
-	tokens = tokenize(normalized)
-	if not tokens:
-		return None, {}
 
-	filtered_tokens = remove_tokens(tokens, _FILLER_WORDS)
+@lru_cache(maxsize=1024)
+def _parse_intent_cached(raw_text: str, prefs_version: int) -> IntentResult:
+	"""Parse raw text; prefs_version keys out results from older preferences."""
+	normalized, tokens = normalize_and_tokenize(raw_text)
+	if not normalized or not tokens:
+		return _EMPTY_RESULT
+
+	filtered_tokens = remove_tokens(tokens, _FILLER_SET)
 	if not filtered_tokens:
-		return None, {}
+		return _EMPTY_RESULT
 
 	# Check for dangerous actions first (before parsing)
 	dangerous_intent = _detect_dangerous_action(raw_text)
 	if dangerous_intent is not None:
 		return dangerous_intent
 
-	# Try LEARN_PREFERENCE intent
-	learn_intent = _detect_learn_preference(filtered_tokens)
-	if learn_intent is not None:
-		return learn_intent
-
-	# Try OPEN_APP intent
-	open_app_intent = _detect_open_app(filtered_tokens)
-	if open_app_intent is not None:
-		return open_app_intent
+	# Only the detector owning the leading verb can match
+	detector = _VERB_DISPATCH.get(filtered_tokens[0])
+	if detector is not None:
+		intent = detector(filtered_tokens)
+		if intent is not None:
+			return intent
 
-	return None, {}
\ No newline at end of file
+	return _EMPTY_RESULT
\ No newline at end of file
@@ -10,28 +10,45 @@ PURPOSE:
 
 from __future__ import annotations
 
-import re
-from typing import Iterable, Tuple
+from typing import AbstractSet, FrozenSet, Iterable, Tuple
 
-_WHITESPACE_RE = re.compile(r"\s+")
+# Punctuation becomes whitespace so "chrome," and "please!" match exactly
+_PUNCT_TABLE = str.maketrans({char: " " for char in ".,!?;:\"'"})
+
+
+def _normalize(raw: str) -> str:
+	"""Lowercase, strip punctuation and trim a str (no type check)."""
+	return raw.lower().translate(_PUNCT_TABLE).strip()
 
 
 def normalize_text(raw: str) -> str:
-	"""Lowercase and trim text safely."""
+	"""Lowercase, strip punctuation and trim text safely."""
 	if not isinstance(raw, str):
 		return ""
-	return raw.strip().lower()
+	return _normalize(raw)
 
 
 def tokenize(raw: str) -> Tuple[str, ...]:
 	"""Split text into tokens using whitespace rules."""
-	normalized = normalize_text(raw)
-	if not normalized:
-		return ()
-	return tuple(token for token in _WHITESPACE_RE.split(normalized) if token)
+	# str.split() with no separator collapses whitespace runs and drops empties.
+	return tuple(normalize_text(raw).split())
+
+
+def normalize_and_tokenize(raw: str) -> Tuple[str, Tuple[str, ...]]:
+	"""Return normalized text and its tokens from a single normalization pass.
+
+	Expects a str; parse_intent validates input before calling this.
+	"""
+	normalized = _normalize(raw)
+	return normalized, tuple(normalized.split())
+
+
+def build_removal_set(removals: Iterable[str]) -> FrozenSet[str]:
+	"""Build a reusable removal set for repeated token filtering."""
+	return frozenset(token for token in removals if isinstance(token, str))
 
 
-def remove_tokens(tokens: Iterable[str], removals: Iterable[str]) -> Tuple[str, ...]:
-	"""Return tokens excluding any in the removal set."""
-	removal_set = {token for token in removals if isinstance(token, str)}
-	return tuple(token for token in tokens if token not in removal_set)
+def remove_tokens(tokens: Iterable[str], removal_set: AbstractSet[str]) -> Tuple[str, ...]:
+	"""Return tokens excluding any in the removal set (see build_removal_set)."""
+	# A list lets tuple() pre-size instead of draining a generator
+	return tuple([token for token in tokens if token not in removal_set])
@@ -0,0 +1,23 @@
+"""
+PROJECT: APRIL
+
+MODULE: Social Phrase Detection
+
+PURPOSE:
+- Share social phrase detection between the emotion and personality layers.
+- Keep matching deterministic; patterns are compiled once at import.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Whole-word matching, so "pretty" or "empty" never read as "ty".
+# Public so the personality layer can fold it into its single social scan.
+GRATITUDE_PATTERN = r"\b(?:thanks|thank\s+you|thx|ty|appreciate\s+it|appreciated)\b"
+_GRATITUDE_RE = re.compile(GRATITUDE_PATTERN)
+
+
+def detect_gratitude(lowered: str) -> bool:
+	"""Detect if user is expressing gratitude in stripped, lowercased text."""
+	return _GRATITUDE_RE.search(lowered) is not None
@@ -54,12 +54,26 @@ without ever becoming unpredictable.
 from typing import Literal
 import time
 
+from cognition.social import detect_gratitude
+
 EmotionalState = Literal["calm", "focused", "friendly"]
 
 _current_state: EmotionalState = "calm"
 _last_command_time = 0.0
 _command_count_window = 0
 
+# Friendly tone adds warmth to responses starting with these
+_FRIENDLY_PREFIXES = ("Okay.", "Opening", "Confirmed")
+
+# Focused tone swaps full open-confirmations for terse equivalents
+_FOCUSED_MAP = {
+    "Opening Chrome.": "Chrome opened.",
+    "Opening Microsoft Edge.": "Edge opened.",
+    "Opening Visual Studio Code.": "Code opened.",
+    "Opening your browser.": "Browser opened.",
+    "Opening your editor.": "Editor opened.",
+}
+
 
 def get_current_state() -> EmotionalState:
     """Return the current emotional state."""
@@ -73,32 +87,19 @@ def set_state(state: EmotionalState) -> None:
         _current_state = state
 
 
-def detect_gratitude(user_input: str) -> bool:
-    """Check if user is expressing thanks."""
-    if not isinstance(user_input, str):
-        return False
-    
-    text_lower = user_input.lower().strip()
-    gratitude_phrases = {
-        "thanks", "thank you", "thanks!", "thank you!", 
-        "ty", "thx", "appreciate it", "appreciated"
-    }
-    
-    return any(phrase in text_lower for phrase in gratitude_phrases)
-
-
 def update_state_on_input(user_input: str) -> None:
     """Update emotional state based on user behavior."""
     global _current_state, _last_command_time, _command_count_window
     
-    current_time = time.time()
-    
     # Check for gratitude
-    if detect_gratitude(user_input):
+    if detect_gratitude(user_input.strip().lower()):
         _current_state = "friendly"
         _command_count_window = 0
         return
     
+    # Monotonic clock: intervals stay correct if the wall clock is adjusted
+    current_time = time.monotonic()
+    
     # Check for rapid commands (within 3 seconds)
     if current_time - _last_command_time < 3:
         _command_count_window += 1
@@ -114,26 +115,19 @@ def update_state_on_input(user_input: str) -> None:
 
 
 def apply_tone(message: str) -> str:
-    """Apply emotional tone to a response message."""
-    if not isinstance(message, str):
-        return message
-    
+    """Apply emotional tone to a response message. Expects a str."""
     # Tone variations don't change meaning, just add slight personality
     if _current_state == "friendly":
         # Add warmth to positive responses
-        if message.startswith("Okay.") or message.startswith("Opening") or message.startswith("Confirmed"):
+        if message.startswith(_FRIENDLY_PREFIXES):
             return f"{message} 🙂"
         elif "from now on" in message:
             return message.replace("from now on.", "from now on! 🙂")
     
     elif _current_state == "focused":
         # Keep responses terse and efficient
-        # Replace longer phrases with shorter ones
-        message = message.replace("Opening Chrome.", "Chrome opened.")
-        message = message.replace("Opening Microsoft Edge.", "Edge opened.")
-        message = message.replace("Opening Visual Studio Code.", "Code opened.")
-        message = message.replace("Opening your browser.", "Browser opened.")
-        message = message.replace("Opening your editor.", "Editor opened.")
+        # Open confirmations are whole messages, so one lookup suffices
+        return _FOCUSED_MAP.get(message, message)
     
     # calm state: default phrasing, no modifications
     return message
\ No newline at end of file
@@ -14,12 +14,48 @@ EMOTIONAL STATES:
 - focused: Concise, efficient
 """
 
+import re
 from typing import Literal
 
+from cognition.social import GRATITUDE_PATTERN
+
 EmotionalState = Literal["calm", "friendly", "focused"]
 
 _current_state: EmotionalState = "calm"
 
+# Greetings must open the message; other categories may appear anywhere
+_GREETINGS = ("hi", "hello", "hey", "good morning", "good afternoon", "good evening")
+_CHECKINS = (
+    "how are you",
+    "how are you doing",
+    "how's it going",
+    "what's up",
+    "whats up",
+    "how do you do",
+    "you okay",
+    "you good",
+)
+_FAREWELLS = ("bye", "goodbye", "see you", "later", "good night")
+_POSITIVE = ("good job", "well done", "nice", "great", "awesome", "perfect")
+
+
+def _alternation(phrases: tuple) -> str:
+    """Join phrases into an escaped regex alternation."""
+    return "|".join(re.escape(phrase) for phrase in phrases)
+
+
+# Branches are tried in priority order, so a single match() picks the same
+# category the old per-phrase loops did. The group name is the phrase type.
+# Gratitude comes last: social phrases have always been checked before it.
+_SOCIAL_RE = re.compile(
+    rf"(?P<greeting>{_alternation(_GREETINGS)})(?= |\Z)"
+    rf"|(?=.*?(?P<checkin>{_alternation(_CHECKINS)}))"
+    rf"|(?=.*?(?P<farewell>{_alternation(_FAREWELLS)}))"
+    rf"|(?=.*?(?P<positive>{_alternation(_POSITIVE)}))"
+    rf"|(?=.*?(?P<gratitude>{GRATITUDE_PATTERN}))",
+    re.DOTALL,
+)
+
 
 def get_emotional_state() -> EmotionalState:
     """Return the current emotional state."""
@@ -39,7 +75,7 @@ def apply_tone(message: str, context: str = "") -> str:
     if context == "gratitude_response":
         return _format_gratitude_response()
     
-    if not isinstance(message, str) or not message:
+    if not message:
         return message
     
     state = _current_state
@@ -72,76 +108,29 @@ def _format_gratitude_response() -> str:
         return "My pleasure."
 
 
-def detect_gratitude(text: str) -> bool:
-    """Detect if user is expressing gratitude."""
-    if not isinstance(text, str):
-        return False
-    
-    text_lower = text.strip().lower()
-    gratitude_phrases = {
-        "thanks",
-        "thank you",
-        "thank you so much",
-        "thanks a lot",
-        "appreciate it",
-        "much appreciated",
-        "thx",
-        "ty",
-    }
-    
-    for phrase in gratitude_phrases:
-        if phrase in text_lower:
-            return True
-    
-    return False
-
-
-def detect_social_phrase(text: str) -> tuple[bool, str]:
+def detect_social_phrase(lowered: str) -> tuple[bool, str]:
     """
     Detect common social phrases that don't require action.
+    Expects text already stripped and lowercased by the caller.
     Returns (is_social, phrase_type).
     """
-    if not isinstance(text, str):
-        return False, ""
-    
-    text_lower = text.strip().lower()
-    
-    # Greetings
-    greetings = {"hi", "hello", "hey", "good morning", "good afternoon", "good evening"}
-    for greeting in greetings:
-        if text_lower == greeting or text_lower.startswith(greeting + " "):
-            return True, "greeting"
-    
-    # Conversational check-ins
-    checkins = [
-        "how are you",
-        "how are you doing",
-        "how's it going",
-        "what's up",
-        "whats up",
-        "how do you do",
-        "you okay",
-        "you good",
-    ]
-    for checkin in checkins:
-        if checkin in text_lower:
-            return True, "checkin"
-    
-    # Farewells
-    farewells = {"bye", "goodbye", "see you", "later", "good night"}
-    for farewell in farewells:
-        if text_lower == farewell or farewell in text_lower:
-            return True, "farewell"
-    
-    # Positive feedback
-    positive = {"good job", "well done", "nice", "great", "awesome", "perfect"}
-    for pos in positive:
-        if pos in text_lower:
-            return True, "positive"
+    phrase_type = classify_social_phrase(lowered)
+    if phrase_type and phrase_type != "gratitude":
+        return True, phrase_type
     
     return False, ""
 
 
+def classify_social_phrase(lowered: str) -> str:
+    """
+    Classify stripped, lowercased text in a single scan.
+    Returns "greeting", "checkin", "farewell", "positive", "gratitude",
+    or "" when the text is not social.
+    """
+    match = _SOCIAL_RE.match(lowered)
+    return match.lastgroup if match else ""
+
+
 def get_social_response(phrase_type: str) -> str:
     """Generate appropriate response for social phrases based on emotional state."""
     state = _current_state
@@ -38,6 +38,7 @@ RULES:
 - Easy to extend later
 """
 
+import re
 from typing import Dict, Any
 
 # Safe intents that can execute immediately
@@ -52,7 +53,7 @@ _CONFIRM_INTENTS = {
 }
 
 # Dangerous keywords that require confirmation
-_DANGEROUS_KEYWORDS = {
+_DANGEROUS_KEYWORDS = frozenset({
     "delete",
     "remove", 
     "shutdown",
@@ -67,7 +68,10 @@ _DANGEROUS_KEYWORDS = {
     "wipe",
     "format",
     "erase",
-}
+})
+
+# Keywords still match as substrings (e.g. "shutdown_now"), but in one pass
+_DANGER_RE = re.compile("|".join(re.escape(keyword) for keyword in sorted(_DANGEROUS_KEYWORDS)))
 
 
 def classify_action(intent_name: str, payload: Dict[str, Any]) -> str:
@@ -84,19 +88,14 @@ def classify_action(intent_name: str, payload: Dict[str, Any]) -> str:
         return "CONFIRM_REQUIRED"
     
     # Check for dangerous keywords in intent name
-    intent_lower = intent_name.lower()
-    for keyword in _DANGEROUS_KEYWORDS:
-        if keyword in intent_lower:
-            return "CONFIRM_REQUIRED"
+    if _DANGER_RE.search(intent_name.lower()):
+        return "CONFIRM_REQUIRED"
     
     # Check for dangerous keywords in payload values
     if isinstance(payload, dict):
         for value in payload.values():
-            if isinstance(value, str):
-                value_lower = value.lower()
-                for keyword in _DANGEROUS_KEYWORDS:
-                    if keyword in value_lower:
-                        return "CONFIRM_REQUIRED"
+            if isinstance(value, str) and _DANGER_RE.search(value.lower()):
+                return "CONFIRM_REQUIRED"
     
     # Unknown intents default to requiring confirmation for safety
     return "CONFIRM_REQUIRED"
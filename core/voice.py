@@ -5,6 +5,7 @@ Provides local speech-to-text and text-to-speech capabilities.
 Uses:
 - pyttsx3 for TTS (offline, OS-native)
 - speech_recognition for STT (local microphone)
+- vosk for offline streaming STT when installed with a model (optional)
 
 This module is PURE I/O. It must NEVER:
 - Parse intents
@@ -13,21 +14,31 @@ This module is PURE I/O. It must NEVER:
 - Make decisions
 
 STRICT RULES:
-- All operations are synchronous (blocking)
+- speak() and listen() are synchronous (blocking) for callers
+- The microphone opens once and is reused across listen() calls, or held
+  open by the background listener; it is released only after an error or
+  when the background listener takes over
 - Failures return None or fail silently
-- No threading
-- No background processes
+- Threads: the TTS worker, which owns the engine, and the optional
+  background listener started by start_background_listening()
 
 HARDENED TTS LIFECYCLE:
-- ONE global engine, initialized once, NEVER destroyed
-- Explicit audio device release after microphone use
-- Self-test loop on startup
+- ONE global engine, initialized once on the TTS worker, NEVER destroyed
+- speak_async() queues speech; speak() queues and waits
+- Silent warm-up utterance on startup
 - Retry logic if speak fails
-- Comprehensive debug logging
+- [TTS]/[STT] debug logging when APRIL_VOICE_DEBUG is set
 """
 
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+import json
+import logging
+import os
+import queue
+import re
 import sys
+import threading
 import time
 
 
@@ -42,15 +53,139 @@ except ImportError:
 try:
     import speech_recognition as sr
     _STT_AVAILABLE = True
+    # Bound once; Sphinx is only a fallback and may be missing from the build
+    _RECOGNIZE_GOOGLE = sr.Recognizer.recognize_google
+    _RECOGNIZE_SPHINX = getattr(sr.Recognizer, "recognize_sphinx", None)
 except ImportError:
     _STT_AVAILABLE = False
     sr = None
+    _RECOGNIZE_GOOGLE = None
+    _RECOGNIZE_SPHINX = None
+
+try:
+    import audioop  # What SpeechRecognition itself measures loudness with
+except ImportError:
+    audioop = None
+
+try:
+    import vosk
+    _VOSK_AVAILABLE = True
+except ImportError:
+    _VOSK_AVAILABLE = False
+    vosk = None
+
+
+# [TTS]/[STT] progress lines; errors are always printed
+_DEBUG = bool(os.environ.get("APRIL_VOICE_DEBUG"))
+_logger = logging.getLogger(__name__)
+
+if _DEBUG:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _logger.addHandler(_handler)
+    _logger.setLevel(logging.DEBUG)
+    _logger.propagate = False
+
+
+def _log(message: str) -> None:
+    """Write one debug line when APRIL_VOICE_DEBUG is set; otherwise do nothing."""
+    if _DEBUG:
+        _logger.debug(message)
+
+
+# Emoji and pictographs SAPI5 cannot voice (incl. variation selector and ZWJ)
+_EMOJI_RE = re.compile("[\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D]+")
 
 
 # Global TTS engine (initialized once, NEVER destroyed)
 _tts_engine = None
 _engine_initialized = False
 
+# Set by the engine's finished-utterance callback; isBusy() is not reliable
+# for the first utterance after startLoop(False) on sapi5
+_utterance_done = threading.Event()
+_callback_engine = None  # Engine the callback is connected to
+_UTTERANCE_BASE_TIMEOUT = 5.0  # Seconds, plus _UTTERANCE_CHAR_TIMEOUT per character
+_UTTERANCE_CHAR_TIMEOUT = 0.15
+
+# TTS worker thread: sole owner of the engine, fed by a bounded FIFO of
+# (generation, clean text); interrupt() bumps the generation to drop backlog
+_TTS_QUEUE_SIZE = 32
+_tts_queue = queue.Queue(maxsize=_TTS_QUEUE_SIZE)
+_tts_generation = 0
+_tts_thread = None
+_tts_thread_lock = threading.Lock()
+_tts_ready = threading.Event()
+_tts_worker_ok = False
+
+# STT: one recognizer for the process; the microphone opens on first listen()
+_recognizer = None
+_microphone = None
+_calibrated = False
+_RECALIBRATE_AFTER = 3  # Phrases in a row heard but not recognized before recalibrating
+_consecutive_fails = 0
+
+# (pause_threshold, phrase_time_limit); the short profile is for yes/no
+# answers. Recognizer.listen asserts pause >= non-speaking, reading the two
+# separately on the listener thread, so only the pause ever changes.
+_NON_SPEAKING_DURATION = 0.3
+_NORMAL_TIMING = (0.8, 3)
+_SHORT_TIMING = (0.3, 1.5)
+
+if _STT_AVAILABLE:
+    _recognizer = sr.Recognizer()
+    # Optimize for short utterances
+    _recognizer.energy_threshold = 300  # Lower = more sensitive
+    _recognizer.dynamic_energy_threshold = True
+    _recognizer.pause_threshold = _NORMAL_TIMING[0]  # Shorter pause detection for quick phrases
+    _recognizer.non_speaking_duration = _NON_SPEAKING_DURATION
+
+# Offline Vosk model, loaded on first listen() or when the background
+# listener starts; False once loading has failed
+_VOSK_MODEL_DIR = os.environ.get(
+    "APRIL_VOSK_MODEL",
+    str(Path(__file__).resolve().parent.parent / "models" / "vosk-model-small-en-us"),
+)
+_VOSK_STABLE_SECONDS = 1.5  # Commit once the partial transcript stops changing
+_vosk_model = None
+
+# Background capture: the listener thread hands each phrase to the
+# recognition worker, which queues (speech start, text) for listen(); audio
+# overlapping APRIL's own speech is discarded, and so is anything captured
+# before the current listen()
+_STT_QUEUE_SIZE = 8
+_CAPTURE_SLACK = 0.1  # Seconds; the recognizer rounds its timings up to whole chunks
+_audio_queue = queue.Queue(maxsize=_STT_QUEUE_SIZE)  # (speech start, AudioData)
+_stt_queue = queue.Queue(maxsize=_STT_QUEUE_SIZE)
+_recognition_thread = None
+_stop_bg = None
+
+# listen() waits 3s for speech to start, then for as long as a phrase is
+# still being captured or recognized, up to _MAX_LISTEN_WAIT in total
+_last_loud = 0.0  # When the background microphone last heard speech-level input
+_PHRASE_END_MARGIN = 0.3  # Seconds past pause_threshold before a phrase is over
+_MAX_LISTEN_WAIT = 10.0
+_LISTEN_POLL = 0.05
+_tts_speaking = threading.Event()
+_tts_last_spoke = 0.0
+
+
+def _warn_on_known_bad_version():
+    """Warn when running a pyttsx3 release known to drop consecutive utterances."""
+    try:
+        from importlib.metadata import version
+        installed = version("pyttsx3")
+    except Exception:
+        installed = getattr(pyttsx3, "__version__", "")
+    
+    if installed == "2.99":
+        print("[TTS] ⚠ pyttsx3 2.99 may skip back-to-back utterances; 2.98 is recommended")
+
+
+def _on_utterance_finished(name, completed) -> None:
+    """finished-utterance callback; fired on the worker during iterate()."""
+    _utterance_done.set()
+
 
 def _initialize_tts(force_reinit=False):
     """
@@ -63,17 +198,17 @@ def _initialize_tts(force_reinit=False):
     Returns:
         bool: True if engine ready, False otherwise
     """
-    global _tts_engine, _engine_initialized
+    global _tts_engine, _engine_initialized, _callback_engine
     
     if not _TTS_AVAILABLE:
-        print("[TTS] pyttsx3 not available")
+        _log("[TTS] pyttsx3 not available")
         return False
     
     if _engine_initialized and _tts_engine is not None and not force_reinit:
         return True
     
     try:
-        print("[TTS] Initializing Windows SAPI5 engine...")
+        _log("[TTS] Initializing Windows SAPI5 engine...")
         
         # Clean up old engine if reinitializing
         if force_reinit and _tts_engine is not None:
@@ -83,14 +218,21 @@ def _initialize_tts(force_reinit=False):
                 _tts_engine = None
             except:
                 pass
-            print("[TTS] Forced reinitialization...")
+            _log("[TTS] Forced reinitialization...")
+        
+        _warn_on_known_bad_version()
         
         # Force Windows SAPI5 driver
         _tts_engine = pyttsx3.init('sapi5')
         
+        # pyttsx3.init may hand back the cached engine; connect only once per engine
+        if _tts_engine is not _callback_engine:
+            _tts_engine.connect('finished-utterance', _on_utterance_finished)
+            _callback_engine = _tts_engine
+        
         # Select female voice
         voices = _tts_engine.getProperty('voices')
-        print(f"[TTS] Found {len(voices)} voices")
+        _log(f"[TTS] Found {len(voices)} voices")
         
         female_voice_set = False
         for voice in voices:
@@ -98,16 +240,16 @@ def _initialize_tts(force_reinit=False):
             # Prioritize: Zira (US) > Hazel (UK) > any female
             if 'zira' in voice_name_lower:
                 _tts_engine.setProperty('voice', voice.id)
-                print(f"[TTS] ✓ Selected: {voice.name}")
+                _log(f"[TTS] ✓ Selected: {voice.name}")
                 female_voice_set = True
                 break
             elif 'hazel' in voice_name_lower and not female_voice_set:
                 _tts_engine.setProperty('voice', voice.id)
-                print(f"[TTS] ✓ Selected: {voice.name}")
+                _log(f"[TTS] ✓ Selected: {voice.name}")
                 female_voice_set = True
             elif 'female' in voice_name_lower and not female_voice_set:
                 _tts_engine.setProperty('voice', voice.id)
-                print(f"[TTS] ✓ Selected: {voice.name}")
+                _log(f"[TTS] ✓ Selected: {voice.name}")
                 female_voice_set = True
         
         # Set voice properties
@@ -115,18 +257,22 @@ def _initialize_tts(force_reinit=False):
         _tts_engine.setProperty('volume', 1.0)  # Maximum volume
         
         _engine_initialized = True
-        print("[TTS] ✓ Engine initialized successfully")
+        _log("[TTS] ✓ Engine initialized successfully")
         
-        # Self-test: speak initialization message
-        print("[TTS] Running self-test...")
+        # Silent warm-up: loads the SAPI voice and opens the audio endpoint
+        # now, so the first real utterance starts without the cold-start lag
+        _log("[TTS] Warming up engine...")
+        previous_volume = _tts_engine.getProperty('volume')
         try:
             _tts_engine.stop()  # Clear any pending audio
-            _tts_engine.say("APRIL voice system initialized")
+            _tts_engine.setProperty('volume', 0.0)
+            _tts_engine.say("APRIL")  # Real text; SAPI may skip whitespace
             _tts_engine.runAndWait()
-            time.sleep(0.2)  # Ensure audio completes before next call
-            print("[TTS] ✓ Self-test passed")
+            _log("[TTS] ✓ Warm-up complete")
         except Exception as e:
-            print(f"[TTS] ⚠ Self-test failed: {e}")
+            _log(f"[TTS] ⚠ Warm-up failed: {e}")
+        finally:
+            _tts_engine.setProperty('volume', previous_volume)
         
         return True
         
@@ -137,9 +283,193 @@ def _initialize_tts(force_reinit=False):
         return False
 
 
+def _start_engine_loop() -> None:
+    """
+    Start the manual engine loop on the worker.
+    
+    The sapi5 driver clears its busy flag on the first iterate() after
+    startLoop; pump once now so that happens before any say().
+    """
+    _tts_engine.startLoop(False)
+    _tts_engine.iterate()
+
+
+def _say_and_wait(text: str) -> None:
+    """Queue one utterance on the worker's engine and pump its loop until done."""
+    _utterance_done.clear()
+    _tts_engine.say(text)
+    
+    # Speak() returns before the audio plays, so wait for the callback;
+    # the deadline only guards against a driver that never fires it
+    deadline = time.monotonic() + _UTTERANCE_BASE_TIMEOUT + _UTTERANCE_CHAR_TIMEOUT * len(text)
+    while not _utterance_done.is_set():
+        _tts_engine.iterate()
+        if time.monotonic() >= deadline:
+            _log("[TTS] ⚠ No finished-utterance callback, giving up waiting")
+            return
+        time.sleep(0.01)
+
+
+def _speak_on_worker(clean_text: str) -> None:
+    """Speak pre-cleaned text from the TTS worker thread, retrying once."""
+    try:
+        _log(f"[TTS] Speaking: '{clean_text}'")
+        _say_and_wait(clean_text)
+        _log("[TTS] ✓ Speech completed successfully")
+        
+    except Exception as e:
+        print(f"[TTS ERROR] Speech failed: {e}")
+        
+        # Cheap reset first: restart the loop on the same engine, which is
+        # usually still alive (pyttsx3 may hand back the cached one anyway)
+        _log("[TTS] Attempting recovery (restart engine loop)...")
+        try:
+            try:
+                _tts_engine.endLoop()
+            except Exception:
+                pass
+            _tts_engine.setProperty('rate', 175)
+            _start_engine_loop()
+            _say_and_wait(clean_text)
+            _log("[TTS] ✓ Recovery successful")
+            return
+        except Exception as e2:
+            print(f"[TTS ERROR] Loop restart failed: {e2}")
+        
+        _log("[TTS] Attempting recovery (reinitialize engine)...")
+        
+        # Retry once with reinitialized engine
+        try:
+            try:
+                _tts_engine.endLoop()
+            except Exception:
+                pass
+            if _initialize_tts(force_reinit=True):
+                _start_engine_loop()
+                _log("[TTS] Retry: speaking after reinitialization...")
+                _say_and_wait(clean_text)
+                _log("[TTS] ✓ Recovery successful")
+            else:
+                _log("[TTS] ✗ Recovery failed - engine won't initialize")
+        except Exception as e2:
+            print(f"[TTS ERROR] Recovery attempt failed: {e2}")
+
+
+def _tts_worker() -> None:
+    """
+    Own the TTS engine for the life of the process.
+    
+    The engine is created, iterated and recovered on this thread only,
+    fed by _tts_queue. A manual startLoop(False) pump replaces runAndWait.
+    """
+    global _tts_worker_ok, _tts_last_spoke
+    
+    # SAPI5 is COM-based; each thread using it must initialize COM
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except Exception:
+        pass
+    
+    _tts_worker_ok = _initialize_tts()
+    _tts_ready.set()
+    if not _tts_worker_ok:
+        return
+    
+    try:
+        _start_engine_loop()
+    except Exception as e:
+        print(f"[TTS ERROR] Could not start engine loop: {e}")
+    
+    while True:
+        generation, clean_text = _tts_queue.get()
+        try:
+            # Checked between utterances; speech already playing is not cut
+            if generation == _tts_generation:
+                _tts_speaking.set()
+                try:
+                    _speak_on_worker(clean_text)
+                finally:
+                    _tts_last_spoke = time.monotonic()
+                    _tts_speaking.clear()
+        finally:
+            _tts_queue.task_done()
+
+
+def _ensure_tts_worker() -> bool:
+    """Start the TTS worker once and report whether its engine came up."""
+    global _tts_thread
+    
+    if not _TTS_AVAILABLE:
+        return False
+    
+    with _tts_thread_lock:
+        if _tts_thread is None:
+            _tts_thread = threading.Thread(target=_tts_worker, name="april-tts", daemon=True)
+            _tts_thread.start()
+    
+    _tts_ready.wait()
+    return _tts_worker_ok
+
+
+def clean_for_speech(text: str) -> str:
+    """Strip emojis and special characters that TTS can't handle."""
+    return _EMOJI_RE.sub("", text).strip()
+
+
+def speak_async(text: str, precleaned: bool = False) -> None:
+    """
+    Queue text for the TTS worker and return immediately.
+    
+    Args:
+        text: The text to speak
+        precleaned: text already went through clean_for_speech()
+    
+    Behavior:
+        - Strips emojis and special characters before queueing
+          (unless precleaned)
+        - Utterances are spoken in FIFO order
+        - Never crashes on failure
+    """
+    _log(f"[TTS] >>> speak() called: '{text[:50]}...'")
+    
+    if not isinstance(text, str) or not text.strip():
+        _log("[TTS] ⚠ Text empty/invalid")
+        return
+    
+    if not _TTS_AVAILABLE:
+        _log("[TTS] ⚠ pyttsx3 not available")
+        return
+    
+    # Ensure worker (and its engine) is running
+    if not _ensure_tts_worker():
+        _log("[TTS] ✗ Initialization failed")
+        return
+    
+    # Remove emojis and special characters that TTS can't handle
+    clean_text = text if precleaned else clean_for_speech(text)
+    if not clean_text:
+        _log("[TTS] ⚠ Clean text is empty after emoji removal")
+        return
+    
+    _tts_queue.put((_tts_generation, clean_text))
+
+
+def flush() -> None:
+    """Block until every queued utterance has been spoken or dropped."""
+    if _tts_thread is not None and _tts_worker_ok:
+        _tts_queue.join()
+
+
+def interrupt() -> None:
+    """Drop queued utterances that have not started playing yet."""
+    global _tts_generation
+    _tts_generation += 1
+
+
 def speak(text: str) -> None:
     """
-    Convert text to speech using the global TTS engine.
+    Convert text to speech using the TTS worker's engine.
     GUARANTEED to attempt speech when VOICE_ENABLED=True.
     
     Args:
@@ -149,69 +479,394 @@ def speak(text: str) -> None:
         None
     
     Behavior:
-        - Uses global engine (never destroyed)
-        - Blocks until speech completes
+        - Uses the worker's global engine (never destroyed)
+        - Blocks until all queued speech completes
         - Retries once if engine fails
         - Never crashes on failure
     """
-    print(f"\n[TTS] >>> speak() called: '{text[:50]}...'")
+    speak_async(text)
+    flush()
+
+
+def _open_microphone():
+    """Open the shared microphone stream on first use and return the source."""
+    global _microphone
+    if _microphone is None:
+        microphone = sr.Microphone()
+        microphone.__enter__()
+        _microphone = microphone
+    return _microphone
+
+
+def _release_microphone() -> None:
+    """Close the shared microphone stream, if open."""
+    global _microphone, _calibrated
+    if _microphone is not None:
+        try:
+            _microphone.__exit__(None, None, None)
+        except Exception:
+            pass
+        _microphone = None
+        _calibrated = False
+
+
+def _calibrate(source) -> None:
+    """Measure ambient noise on an open source and set the energy threshold."""
+    global _calibrated
+    # Proper ambient noise calibration for better detection
+    _log("[STT] Calibrating for ambient noise...")
+    _recognizer.adjust_for_ambient_noise(source, duration=0.5)
+    _calibrated = True
+
+
+def calibrate() -> bool:
+    """
+    Calibrate for ambient noise now instead of on the next listen().
     
-    if not isinstance(text, str) or not text.strip():
-        print("[TTS] ⚠ Text empty/invalid")
-        return
+    Useful before a series of listens (e.g. the voice test) so the first
+    one starts recording immediately. With the background listener
+    running, the listener is restarted, which recalibrates it.
     
-    if not _TTS_AVAILABLE:
-        print("[TTS] ⚠ pyttsx3 not available")
-        return
+    Returns:
+        bool: True if calibration ran
+    """
+    if not _STT_AVAILABLE:
+        return False
     
-    # Ensure engine is initialized
-    if not _initialize_tts():
-        print("[TTS] ✗ Initialization failed")
-        return
+    if _stop_bg is not None:
+        stop_background_listening(wait=True)
+        return start_background_listening()
     
     try:
-        # Remove emojis and special characters that TTS can't handle
-        clean_text = text.replace("😊", "").replace("🙂", "").replace("✨", "").strip()
-        if not clean_text:
-            print("[TTS] ⚠ Clean text is empty after emoji removal")
-            return
+        _calibrate(_open_microphone())
+        return True
+    except Exception as e:
+        print(f"[STT ERROR] Calibration failed: {e}")
+        _release_microphone()
+        return False
+
+
+def warm_up_stt() -> bool:
+    """
+    Open the shared microphone stream and load the Vosk model (if any)
+    ahead of the first listen().
+    
+    Calibration is left to listen()/calibrate(), since it should run
+    while the room is quiet. Not thread-safe against a concurrent
+    listen(); join the calling thread before listening.
+    
+    Returns:
+        bool: True if the microphone is open
+    """
+    if not _STT_AVAILABLE:
+        return False
+    
+    # Model load is the slowest part of a cold Vosk start
+    _get_vosk_model()
+    
+    try:
+        _open_microphone()
+        return True
+    except Exception as e:
+        print(f"[STT ERROR] Microphone failed to open: {e}")
+        return False
+
+
+def get_recognizer():
+    """Return the shared sr.Recognizer, or None when STT is unavailable."""
+    return _recognizer
+
+
+class _LoudnessStream:
+    """Microphone stream wrapper that records when input crossed the energy threshold."""
+    
+    def __init__(self, stream, sample_width: int):
+        self._stream = stream
+        self._sample_width = sample_width
+    
+    def read(self, size):
+        global _last_loud
+        buffer = self._stream.read(size)
+        # Same test Recognizer.listen uses to decide speech has started
+        if buffer and audioop.rms(buffer, self._sample_width) > _recognizer.energy_threshold:
+            _last_loud = time.monotonic()
+        return buffer
+    
+    def close(self):
+        self._stream.close()
+
+
+if _STT_AVAILABLE:
+    class _MonitoredMicrophone(sr.Microphone):
+        """Microphone whose stream updates _last_loud; used by the background listener."""
         
-        print(f"[TTS] Speaking: '{clean_text}'")
+        def __enter__(self):
+            source = super().__enter__()
+            if audioop is not None:
+                self.stream = _LoudnessStream(self.stream, self.SAMPLE_WIDTH)
+            return source
+
+
+def _get_vosk_model():
+    """Load the Vosk model once; return None when offline STT is unavailable."""
+    global _vosk_model
+    
+    if _vosk_model is None:
+        _vosk_model = False
+        if _VOSK_AVAILABLE and os.path.isdir(_VOSK_MODEL_DIR):
+            try:
+                vosk.SetLogLevel(-1)
+                _vosk_model = vosk.Model(_VOSK_MODEL_DIR)
+                _log(f"[STT] ✓ Vosk model loaded from {_VOSK_MODEL_DIR}")
+            except Exception as e:
+                print(f"[STT ERROR] Vosk model failed to load: {e}")
+    
+    return _vosk_model or None
+
+
+def _stt_backend() -> str:
+    """Select the primary recognizer: "vosk" when usable, else "google"."""
+    return "vosk" if _get_vosk_model() is not None else "google"
+
+
+def _stream_vosk(source, timeout: float, phrase_time_limit: float) -> Iterator[Tuple[str, bool]]:
+    """
+    Stream microphone audio into Vosk, yielding (text, is_final) pairs.
+    
+    Each change in the partial transcript is yielded with is_final False.
+    The phrase ends when Vosk detects its end, or once the partial
+    transcript has been stable for _VOSK_STABLE_SECONDS; the transcript
+    is then yielded with is_final True ("" when no speech starts within
+    timeout).
+    """
+    recognizer = vosk.KaldiRecognizer(_get_vosk_model(), source.SAMPLE_RATE)
+    started = time.monotonic()
+    speech_started = None
+    last_partial = ""
+    last_change = started
+    
+    while True:
+        data = source.stream.read(source.CHUNK)
+        now = time.monotonic()
         
-        # Use global engine
-        _tts_engine.stop()  # Clear any pending audio queue
-        _tts_engine.say(clean_text)
-        _tts_engine.runAndWait()
-        time.sleep(0.2)  # Ensure audio fully completes before returning
+        if recognizer.AcceptWaveform(data):
+            text = json.loads(recognizer.Result()).get("text", "")
+            if text:
+                yield text, True
+                return
+        else:
+            partial = json.loads(recognizer.PartialResult()).get("partial", "")
+            if partial != last_partial:
+                last_partial = partial
+                last_change = now
+                if partial:
+                    if speech_started is None:
+                        speech_started = now
+                    yield partial, False
         
-        print("[TTS] ✓ Speech completed successfully")
+        if speech_started is None:
+            if now - started >= timeout:
+                yield "", True
+                return
+        elif now - last_change >= _VOSK_STABLE_SECONDS or now - speech_started >= phrase_time_limit:
+            yield json.loads(recognizer.FinalResult()).get("text", "") or last_partial, True
+            return
+
+
+def _listen_vosk(source, timeout: float, phrase_time_limit: float) -> str:
+    """Stream microphone audio into Vosk and return only the final transcript."""
+    for text, is_final in _stream_vosk(source, timeout, phrase_time_limit):
+        if is_final:
+            return text
+    return ""
+
+
+def _accept_transcript(text: str, engine: str) -> Optional[str]:
+    """Apply confidence filtering to a transcript; None when it is rejected."""
+    if not text:
+        return None
+    cleaned = text.strip().lower()
+    # Reject very short garbage (but allow "hi", "no", etc.)
+    if len(cleaned) < 2:
+        _log(f"[STT] ⚠ Rejected too short: '{cleaned}'")
+        return None
+    # Return original casing for proper handling
+    _log(f"[STT] ✓ Recognized ({engine}): '{text}'")
+    return text.strip()
+
+
+def _recognize_audio(recognizer, audio) -> Optional[str]:
+    """Transcribe captured audio with Google, falling back to Sphinx."""
+    _log("[STT] Processing audio...")
+    
+    # Use Google Web Speech API (fast and accurate)
+    try:
+        return _accept_transcript(_RECOGNIZE_GOOGLE(recognizer, audio), "Google")
         
+    except sr.UnknownValueError:
+        # Speech was unintelligible
+        _log("[STT] ⚠ Speech unintelligible")
+        return None
+    except sr.RequestError:
+        if _RECOGNIZE_SPHINX is None:
+            _log("[STT] Google API unavailable, no Sphinx fallback")
+            return None
+        # Google not available, try Sphinx as fallback
+        _log("[STT] Google API unavailable, trying Sphinx...")
+        try:
+            return _accept_transcript(_RECOGNIZE_SPHINX(recognizer, audio), "Sphinx")
+        except Exception as e:
+            print(f"[STT ERROR] Sphinx failed: {e}")
+            return None
+
+
+def _recognize_audio_vosk(audio) -> Optional[str]:
+    """Transcribe a captured phrase with the offline Vosk model."""
+    recognizer = vosk.KaldiRecognizer(_get_vosk_model(), 16000)
+    recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=16000, convert_width=2))
+    return _accept_transcript(json.loads(recognizer.FinalResult()).get("text", ""), "Vosk")
+
+
+def _speech_started(audio, ended: float) -> float:
+    """
+    Estimate when the user started talking in a background-captured phrase.
+    
+    Recognizer.listen keeps _NON_SPEAKING_DURATION of silence before and
+    after the speech, and returns pause_threshold after the speech ends,
+    or right away when phrase_time_limit cuts the phrase off.
+    """
+    duration = len(audio.frame_data) / float(audio.sample_rate * audio.sample_width)
+    recorded = duration - _NON_SPEAKING_DURATION  # Without the lead-in
+    if recorded >= _NORMAL_TIMING[1] - _CAPTURE_SLACK:
+        return ended - recorded
+    return ended - _recognizer.pause_threshold - (recorded - _NON_SPEAKING_DURATION)
+
+
+def _on_audio(recognizer, audio) -> None:
+    """Background listener callback: hand one phrase to the recognition worker."""
+    # The phrase ended just now; drop it if APRIL was talking while it was captured
+    captured_from = _speech_started(audio, time.monotonic())
+    if _tts_speaking.is_set() or _tts_last_spoke > captured_from:
+        _log("[STT] ⚠ Dropped audio overlapping APRIL's speech")
+        return
+    
+    # Recognition (possibly a network round trip) must not stall capture
+    try:
+        _audio_queue.put_nowait((captured_from, audio))
+    except queue.Full:
+        _log("[STT] ⚠ Recognition backlog full, dropping phrase")
+
+
+def _recognition_worker() -> None:
+    """Recognize phrases from _audio_queue and queue the text for listen()."""
+    global _vosk_model
+    
+    while True:
+        captured_from, audio = _audio_queue.get()
+        try:
+            text = None
+            try:
+                if _stt_backend() == "vosk":
+                    try:
+                        text = _recognize_audio_vosk(audio)
+                    except Exception as e:
+                        print(f"[STT ERROR] Vosk failed, using Google from now on: {e}")
+                        _vosk_model = False
+                        text = _recognize_audio(_recognizer, audio)
+                else:
+                    text = _recognize_audio(_recognizer, audio)
+            except Exception as e:
+                print(f"[STT ERROR] Background recognition failed: {e}")
+            
+            # None tells listen() a phrase was heard but not recognized
+            try:
+                _stt_queue.put_nowait((captured_from, text or None))
+            except queue.Full:
+                _log("[STT] ⚠ Phrase queue full, dropping phrase")
+        finally:
+            _audio_queue.task_done()
+
+
+def _phrase_pending(now: float) -> bool:
+    """True while the background listener is mid-phrase or still recognizing one."""
+    if _audio_queue.unfinished_tasks:
+        return True
+    return now - _last_loud <= _recognizer.pause_threshold + _PHRASE_END_MARGIN
+
+
+def start_background_listening() -> bool:
+    """
+    Keep the microphone capturing on a background thread.
+    
+    Phrases are recognized on a worker thread as soon as they end and
+    queued, so listen() only waits on the queue. Safe to call more than
+    once.
+    
+    Returns:
+        bool: True if the background listener is running
+    """
+    global _stop_bg, _calibrated, _recognition_thread
+    
+    if not _STT_AVAILABLE:
+        return False
+    if _stop_bg is not None:
+        return True
+    
+    # Load the Vosk model here, not on the worker during the first phrase
+    _get_vosk_model()
+    
+    if _recognition_thread is None:
+        _recognition_thread = threading.Thread(
+            target=_recognition_worker, name="april-stt", daemon=True
+        )
+        _recognition_thread.start()
+    
+    try:
+        # The listener opens its own stream on the same device
+        _release_microphone()
+        microphone = _MonitoredMicrophone()
+        with microphone as source:
+            _log("[STT] Calibrating for ambient noise...")
+            _recognizer.adjust_for_ambient_noise(source, duration=0.5)
+        _calibrated = True
+        _stop_bg = _recognizer.listen_in_background(
+            microphone, _on_audio, phrase_time_limit=_NORMAL_TIMING[1]
+        )
+        _log("[STT] ✓ Background listening started")
+        return True
     except Exception as e:
-        print(f"[TTS ERROR] Speech failed: {e}")
-        print("[TTS] Attempting recovery (reinitialize engine)...")
-        
-        # Retry once with reinitialized engine
+        print(f"[STT ERROR] Background listening failed to start: {e}")
+        _calibrated = False
+        return False
+
+
+def stop_background_listening(wait: bool = False) -> None:
+    """Stop the background listener, if running; listen() records directly again."""
+    global _stop_bg, _calibrated
+    
+    if _stop_bg is not None:
         try:
-            if _initialize_tts(force_reinit=True):
-                print("[TTS] Retry: speaking after reinitialization...")
-                _tts_engine.stop()  # Clear audio queue
-                _tts_engine.say(clean_text)
-                _tts_engine.runAndWait()
-                time.sleep(0.2)  # Ensure audio completes
-                print("[TTS] ✓ Recovery successful")
-            else:
-                print("[TTS] ✗ Recovery failed - engine won't initialize")
-        except Exception as e2:
-            print(f"[TTS ERROR] Recovery attempt failed: {e2}")
+            _stop_bg(wait_for_stop=wait)
+        except Exception:
+            pass
+        _stop_bg = None
+        _calibrated = False
 
 
-def listen() -> Optional[str]:
+def listen(short: bool = False) -> Optional[str]:
     """
     Listen to microphone and convert speech to text.
     Listens once per call (not continuous).
     
-    CRITICAL: After microphone use, explicitly releases audio device
-    with delay to prevent TTS contention.
+    With the background listener running, this only waits for the next
+    phrase it has recognized: up to 3s for speech to start, then until
+    that phrase has been recognized. Otherwise the recognizer and
+    the opened microphone stream are reused across calls; ambient noise
+    calibration runs only on the first call.
+    
+    Args:
+        short: Expect a one- or two-word answer (e.g. yes/no); ends the
+            phrase after a 0.3s pause and caps it at 1.5s
     
     Returns:
         str: Transcribed text if successful
@@ -222,97 +877,180 @@ def listen() -> Optional[str]:
         - Returns None on any failure
         - Never throws exceptions outward
         - Optimized for short phrases like "hi", "hello", "thanks"
-        - Releases audio device after use (150ms delay for driver)
+        - Releases the audio device only after an unexpected error
+        - Recalibrates after _RECALIBRATE_AFTER phrases in a row were heard
+          but not recognized; a timeout (e.g. the user typed instead) does
+          not count
     """
+    global _calibrated, _consecutive_fails
+    
     if not _STT_AVAILABLE:
         return None
     
-    recognizer = sr.Recognizer()
+    # Also read by the background listener on its next phrase
+    pause, phrase_time_limit = _SHORT_TIMING if short else _NORMAL_TIMING
+    _recognizer.pause_threshold = pause
     
-    # Optimize for short utterances
-    recognizer.energy_threshold = 300  # Lower = more sensitive
-    recognizer.dynamic_energy_threshold = True
-    recognizer.pause_threshold = 0.8  # Shorter pause detection for quick phrases
+    if _stop_bg is not None:
+        text, heard = _listen_background()
+    else:
+        text, heard = _listen_direct(phrase_time_limit)
     
-    result = None
+    if text:
+        _consecutive_fails = 0
+    elif heard:
+        _consecutive_fails += 1
+        if _consecutive_fails >= _RECALIBRATE_AFTER:
+            # Noise level has probably changed; calibrate again on the next call
+            _log("[STT] Repeated failures, recalibrating on next listen")
+            _consecutive_fails = 0
+            _calibrated = False
+    
+    return text
+
+
+def _listen_background() -> Tuple[Optional[str], bool]:
+    """
+    Wait for the next phrase from the background listener.
+    
+    Only phrases whose capture started after this call are returned, so
+    one heard during an earlier prompt (or after it timed out) is never
+    taken as the answer to this one.
+    
+    Returns:
+        (text, heard): text is None unless recognized; heard is True when
+        a phrase was captured, even if it was not recognized
+    """
+    if not _calibrated:
+        # Restarting the listener recalibrates before it reopens the device;
+        # done before the clock starts so it does not eat the wait
+        stop_background_listening(wait=True)
+        start_background_listening()
+    
+    prompt_started = time.monotonic()
+    
+    # Discard phrases left over from earlier prompts
+    while True:
+        try:
+            _stt_queue.get_nowait()
+        except queue.Empty:
+            break
+    
+    # The 3s limit is for speech to start; a phrase under way is waited for
+    onset_deadline = prompt_started + 3
+    give_up = prompt_started + _MAX_LISTEN_WAIT
+    while True:
+        try:
+            captured_from, text = _stt_queue.get(timeout=_LISTEN_POLL)
+        except queue.Empty:
+            now = time.monotonic()
+            if now >= give_up or (now >= onset_deadline and not _phrase_pending(now)):
+                _log("[STT] ⚠ Timeout - no speech detected")
+                return None, False
+            continue
+        if captured_from >= prompt_started - _CAPTURE_SLACK:
+            return text, True
+        _log(f"[STT] ⚠ Dropped stale phrase: '{text}'")
+
+
+def _listen_direct(phrase_time_limit: float) -> Tuple[Optional[str], bool]:
+    """
+    Record and recognize one phrase on the caller's thread.
+    
+    Returns:
+        (text, heard), as for _listen_background()
+    """
+    global _vosk_model
+    
+    recognizer = _recognizer
     
     try:
-        with sr.Microphone() as source:
-            # Proper ambient noise calibration for better detection
-            print("[STT] Calibrating for ambient noise...")
-            recognizer.adjust_for_ambient_noise(source, duration=0.5)
-            
-            print("[STT] Listening...")
-            # Listen for speech - optimized for short phrases
-            audio = recognizer.listen(source, timeout=3, phrase_time_limit=3)
-            
-            # CRITICAL: Microphone context closes here
-            # source.__exit__ is called, releasing the device
-        
-        # CRITICAL: Force audio device release with delay
-        # Windows audio drivers need time to fully release the device
-        print("[STT] Releasing audio device...")
-        time.sleep(0.15)  # 150ms delay for driver to release device
+        source = _open_microphone()
         
-        # Now process the audio (microphone is released)
-        print("[STT] Processing audio...")
+        if not _calibrated:
+            _calibrate(source)
         
-        # Use Google Web Speech API (fast and accurate)
-        try:
-            text = recognizer.recognize_google(audio)
-            
-            # Confidence filtering
-            if text:
-                cleaned = text.strip().lower()
-                # Reject very short garbage (but allow "hi", "no", etc.)
-                if len(cleaned) < 2:
-                    print(f"[STT] ⚠ Rejected too short: '{cleaned}'")
-                    return None
-                # Return original casing for proper handling
-                print(f"[STT] ✓ Recognized: '{text}'")
-                result = text.strip()
-                return result
-            return None
-            
-        except sr.UnknownValueError:
-            # Speech was unintelligible
-            print("[STT] ⚠ Speech unintelligible")
-            return None
-        except sr.RequestError:
-            # Google not available, try Sphinx as fallback
-            print("[STT] Google API unavailable, trying Sphinx...")
+        # Offline streaming recognizer first; Google/Sphinx remain fallbacks
+        if _stt_backend() == "vosk":
+            _log("[STT] Listening (Vosk)...")
             try:
-                text = recognizer.recognize_sphinx(audio)
-                if text:
-                    cleaned = text.strip().lower()
-                    if len(cleaned) < 2:
-                        print(f"[STT] ⚠ Rejected too short: '{cleaned}'")
-                        return None
-                    print(f"[STT] ✓ Recognized (Sphinx): '{text}'")
-                    result = text.strip()
-                    return result
-                return None
+                text = _listen_vosk(source, timeout=3, phrase_time_limit=phrase_time_limit)
+                if not text:
+                    _log("[STT] ⚠ Timeout - no speech detected")
+                    return None, False
+                return _accept_transcript(text, "Vosk"), True
             except Exception as e:
-                print(f"[STT ERROR] Sphinx failed: {e}")
-                return None
+                print(f"[STT ERROR] Vosk failed, using Google from now on: {e}")
+                _vosk_model = False
+        
+        _log("[STT] Listening...")
+        # Listen for speech - optimized for short phrases
+        audio = recognizer.listen(source, timeout=3, phrase_time_limit=phrase_time_limit)
+        return _recognize_audio(recognizer, audio), True
     
     except sr.WaitTimeoutError:
-        print("[STT] ⚠ Timeout - no speech detected")
-        
-        # Still release audio device on timeout
-        time.sleep(0.15)
-        return None
+        _log("[STT] ⚠ Timeout - no speech detected")
+        return None, False
     except Exception as e:
         print(f"[STT ERROR] Unexpected error: {e}")
         
-        # Still release audio device on error
-        time.sleep(0.15)
-        return None
+        # The stream may be broken; release it so the next call reopens it
+        _release_microphone()
+        return None, False
+
+
+def listen_stream(short: bool = False) -> Iterator[Tuple[str, bool]]:
+    """
+    Listen for one phrase, yielding the transcript while it is spoken.
+    
+    Yields (text, is_final) pairs: partial transcripts as they change,
+    then the accepted transcript once with is_final True. Nothing final
+    is yielded when no speech was recognized.
+    
+    Only Vosk reports partial transcripts; with the background listener
+    running or without a Vosk model, this yields the result of listen()
+    once as the final transcript.
+    
+    Args:
+        short: Same as for listen()
+    """
+    global _vosk_model
+    
+    if not _STT_AVAILABLE:
+        return
+    
+    if _stop_bg is not None or _stt_backend() != "vosk":
+        text = listen(short=short)
+        if text:
+            yield text, True
+        return
+    
+    phrase_time_limit = (_SHORT_TIMING if short else _NORMAL_TIMING)[1]
+    
+    try:
+        source = _open_microphone()
+        
+        if not _calibrated:
+            _calibrate(source)
+        
+        _log("[STT] Listening (Vosk)...")
+        for text, is_final in _stream_vosk(source, timeout=3, phrase_time_limit=phrase_time_limit):
+            if not is_final:
+                yield text, False
+                continue
+            text = _accept_transcript(text, "Vosk")
+            if text:
+                yield text, True
+            return
+    except Exception as e:
+        print(f"[STT ERROR] Vosk failed, using Google from now on: {e}")
+        _vosk_model = False
+        _release_microphone()
 
 
 def is_tts_available() -> bool:
     """Check if text-to-speech is available."""
-    return _TTS_AVAILABLE and _initialize_tts()
+    return _TTS_AVAILABLE and _ensure_tts_worker()
 
 
 def is_stt_available() -> bool:
@@ -90,26 +90,59 @@ RULES:
 
 """Entry point for APRIL day-1 command execution backbone."""
 
+import re
 import sys
-from typing import Optional, Callable, Dict, Any
+from functools import lru_cache
+from typing import Optional, Callable, Dict, Any, Tuple
 
 from cognition.intent import parse_intent
 from core.policy import classify_action, get_confirmation_message
 from core.personality import (
-    detect_gratitude,
-    detect_social_phrase,
+    classify_social_phrase,
     get_social_response,
     apply_tone,
+    get_emotional_state,
     set_emotional_state,
 )
-from core.voice import speak, listen, is_tts_available, is_stt_available
+from core.voice import (
+    clean_for_speech,
+    speak_async,
+    flush,
+    interrupt,
+    listen,
+    start_background_listening,
+    is_tts_available,
+    is_stt_available,
+)
 from memory.action_history import record_action, detect_pattern
+from memory.preferences import get_preference, set_preference
+
+# Resolved once; the open skill stays optional so APRIL can run without it
+try:
+    from skills.system_control.open_app import open_application as _open_application  # type: ignore
+except Exception:
+    _open_application = None  # type: Optional[Callable[[str, str], Optional[str]]]
+
+_ALLOWED_APP_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-.")
+# Finds any character outside the allow-list in one C-level scan
+_DISALLOWED_APP_CHAR_RE = re.compile("[^" + re.escape("".join(sorted(_ALLOWED_APP_CHARS))) + "]")
+
+# Reply vocabularies for confirmations, suggestions and exiting
+_CONFIRM_YES = frozenset({"yes", "y", "ok", "okay", "sure", "confirm"})
+_CONFIRM_NO = frozenset({"no", "n", "cancel", "never mind", "nevermind"})
+_SUGGESTION_YES = frozenset({"yes", "y", "ok", "okay", "sure"})
+_SUGGESTION_NO = frozenset({"no", "n", "not now", "nope"})
+_EXIT_COMMANDS = frozenset({"exit", "quit"})
 
-_ALLOWED_APP_CHARS = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-.")
+# Category names resolved through preferences rather than opened directly
+_CATEGORY_APPS = frozenset({"browser", "editor"})
 
 # Voice mode toggle - set to True to enable voice I/O
 VOICE_ENABLED = True
 
+# Responses are queued for TTS one sentence at a time
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 # Confirmation state - session scoped, not persisted
 _pending_action = None  # type: Optional[Dict[str, Any]]
 
@@ -117,24 +150,44 @@ _pending_action = None  # type: Optional[Dict[str, Any]]
 _suggested_action = None  # type: Optional[Dict[str, Any]]
 
 
+@lru_cache(maxsize=256)
+def _speech_sentences(message: str) -> Tuple[str, ...]:
+    """Split a response into sentences cleaned for TTS, dropping empty ones."""
+    cleaned = (clean_for_speech(sentence) for sentence in _SENTENCE_SPLIT_RE.split(message))
+    return tuple(sentence for sentence in cleaned if sentence)
+
+
+def _speak_sentences(message: str) -> None:
+    """Queue a response for TTS sentence by sentence without waiting."""
+    for sentence in _speech_sentences(message):
+        speak_async(sentence, precleaned=True)
+
+
+@lru_cache(maxsize=256)
+def _toned(message: str, context: str, state: str) -> str:
+    """Return apply_tone output; state is only part of the cache key."""
+    return apply_tone(message, context=context)
+
+
 def _print_april(message: str) -> None:
     """Emit a response in APRIL's required voice with emotional tone."""
-    toned_message = apply_tone(message, context="")
-    print(f"APRIL: {toned_message}")
+    toned_message = _toned(message, "", get_emotional_state())
+    # Buffered single write; input() and the voice prompt flush before waiting
+    sys.stdout.write(f"APRIL: {toned_message}\n")
     
     # Speak if voice mode is enabled
     if VOICE_ENABLED:
-        speak(toned_message)
+        _speak_sentences(toned_message)
 
 
 def _print_april_with_context(message: str, context: str) -> None:
     """Emit a response with specific emotional context."""
-    toned_message = apply_tone(message, context=context)
-    print(f"APRIL: {toned_message}")
+    toned_message = _toned(message, context, get_emotional_state())
+    sys.stdout.write(f"APRIL: {toned_message}\n")
     
     # Speak if voice mode is enabled
     if VOICE_ENABLED:
-        speak(toned_message)
+        _speak_sentences(toned_message)
 
 
 def _sanitize_app_name(raw: str) -> Optional[str]:
@@ -142,7 +195,7 @@ def _sanitize_app_name(raw: str) -> Optional[str]:
     candidate = raw.strip()
     if not candidate:
         return None
-    if any(ch not in _ALLOWED_APP_CHARS for ch in candidate):
+    if _DISALLOWED_APP_CHAR_RE.search(candidate):
         return None
     return candidate
 
@@ -162,20 +215,12 @@ def _handle_open_with_category(app_name: str, category: str) -> None:
         _print_april("need an application name.")
         return
 
-    try:
-        from skills.system_control import open_app  # type: ignore
-    except Exception:
+    if _open_application is None:
         _print_april("open skill offline.")
         return
 
-    open_application: Optional[Callable[[str, str], Optional[str]]]
-    open_application = getattr(open_app, "open_application", None)
-    if not callable(open_application):
-        _print_april("open skill incomplete.")
-        return
-
     try:
-        message = open_application(app_name, category)
+        message = _open_application(app_name, category)
     except Exception:
         _print_april("open failed safely.")
         return
@@ -186,88 +231,92 @@ def _handle_open_with_category(app_name: str, category: str) -> None:
         _print_april(f"opening {app_name}.")
 
 
-def _execute_action(intent_name: str, payload: Dict[str, Any]) -> None:
-    """Execute a confirmed action based on intent type."""
+def _post_open_suggest(action_sig: str) -> None:
+    """Record an open action and offer the follow-up the user usually does."""
     global _suggested_action
     
-    if intent_name == "DANGEROUS_ACTION":
-        _print_april("Confirmed. This action is not implemented yet.")
-        return
+    # Record this action for pattern detection
+    record_action(action_sig)
     
-    if intent_name == "LEARN_PREFERENCE":
-        if isinstance(payload, dict):
-            category = payload.get("category", "").strip().lower()
-            app = payload.get("app", "").strip().lower()
-            if category and app:
-                try:
-                    from memory.preferences import set_preference
-                    set_preference(category, app)
-                    _print_april(f"Okay. I'll use {app} as your {category} from now on.")
-                except Exception:
-                    _print_april("I couldn't learn that preference.")
-            else:
-                _print_april("I need both an app and category to learn.")
+    # Check for patterns
+    suggested_next = detect_pattern(action_sig)
+    if suggested_next and not _suggested_action:
+        # Parse the suggested action
+        _suggested_action = {
+            "intent_name": "OPEN_APP",
+            "payload": {"app": suggested_next.replace("open ", "")}
+        }
+        _print_april(f"You usually {suggested_next} after this. Want me to do that now?")
+
+
+def _handle_dangerous_intent(payload: Dict[str, Any]) -> None:
+    """Acknowledge a confirmed dangerous action; none are implemented yet."""
+    _print_april("Confirmed. This action is not implemented yet.")
+
+
+def _handle_learn_intent(payload: Dict[str, Any]) -> None:
+    """Store a learned category preference."""
+    if isinstance(payload, dict):
+        category = payload.get("category", "").strip().lower()
+        app = payload.get("app", "").strip().lower()
+        if category and app:
+            try:
+                set_preference(category, app)
+                _print_april(f"Okay. I'll use {app} as your {category} from now on.")
+            except Exception:
+                _print_april("I couldn't learn that preference.")
         else:
-            _print_april("I couldn't understand that preference.")
+            _print_april("I need both an app and category to learn.")
+    else:
+        _print_april("I couldn't understand that preference.")
 
-    elif intent_name == "OPEN_APP":
-        if isinstance(payload, dict):
-            app_name = payload.get("app", "").strip().lower()
-            category = payload.get("category", "").strip().lower()
-            
-            # If this is a direct category lookup, resolve it
-            if not category and app_name in {"browser", "editor"}:
-                try:
-                    from memory.preferences import get_preference
-                    resolved_app = get_preference(app_name)
-                    if resolved_app:
-                        _handle_open_with_category(resolved_app, app_name)
-                        # Record this action for pattern detection
-                        action_sig = f"open {app_name}"
-                        record_action(action_sig)
-                        # Check for patterns
-                        suggested_next = detect_pattern(action_sig)
-                        if suggested_next and not _suggested_action:
-                            # Parse the suggested action
-                            _suggested_action = {
-                                "intent_name": "OPEN_APP",
-                                "payload": {"app": suggested_next.replace("open ", "")}
-                            }
-                            _print_april(f"You usually {suggested_next} after this. Want me to do that now?")
-                    else:
-                        _print_april(f"I don't have a {app_name} configured.")
-                except Exception:
-                    _print_april("preference lookup failed safely.")
-            else:
-                _handle_open_with_category(app_name, category)
-                # Record this action for pattern detection
-                if category:
-                    action_sig = f"open {category}"
+
+def _handle_open_intent(payload: Dict[str, Any]) -> None:
+    """Open an app directly or through a category preference."""
+    if isinstance(payload, dict):
+        app_name = payload.get("app", "").strip().lower()
+        category = payload.get("category", "").strip().lower()
+        
+        # If this is a direct category lookup, resolve it
+        if not category and app_name in _CATEGORY_APPS:
+            try:
+                resolved_app = get_preference(app_name)
+                if resolved_app:
+                    _handle_open_with_category(resolved_app, app_name)
+                    _post_open_suggest(f"open {app_name}")
                 else:
-                    action_sig = f"open {app_name}"
-                record_action(action_sig)
-                # Check for patterns
-                suggested_next = detect_pattern(action_sig)
-                if suggested_next and not _suggested_action:
-                    # Parse the suggested action
-                    _suggested_action = {
-                        "intent_name": "OPEN_APP",
-                        "payload": {"app": suggested_next.replace("open ", "")}
-                    }
-                    _print_april(f"You usually {suggested_next} after this. Want me to do that now?")
+                    _print_april(f"I don't have a {app_name} configured.")
+            except Exception:
+                _print_april("preference lookup failed safely.")
         else:
-            _handle_open("")
+            _handle_open_with_category(app_name, category)
+            _post_open_suggest(f"open {category or app_name}")
     else:
+        _handle_open("")
+
+
+# Intent name -> executor; one lookup instead of a comparison chain
+_INTENT_HANDLERS = {
+    "DANGEROUS_ACTION": _handle_dangerous_intent,
+    "LEARN_PREFERENCE": _handle_learn_intent,
+    "OPEN_APP": _handle_open_intent,
+}  # type: Dict[str, Callable[[Dict[str, Any]], None]]
+
+
+def _execute_action(intent_name: str, payload: Dict[str, Any]) -> None:
+    """Execute a confirmed action based on intent type."""
+    handler = _INTENT_HANDLERS.get(intent_name)
+    if handler is None:
         _print_april("I can't do that yet.")
+        return
+    handler(payload)
 
 
-def _handle_confirmation_response(response: str) -> None:
-    """Handle yes/no confirmation responses."""
+def _handle_confirmation_response(response_lower: str) -> None:
+    """Handle yes/no confirmation responses, already stripped and lowercased."""
     global _pending_action
     
-    response_lower = response.strip().lower()
-    
-    if response_lower in {"yes", "y", "ok", "okay", "sure", "confirm"}:
+    if response_lower in _CONFIRM_YES:
         if _pending_action:
             intent_name = _pending_action.get("intent_name")
             payload = _pending_action.get("payload", {})
@@ -275,9 +324,11 @@ def _handle_confirmation_response(response: str) -> None:
             _execute_action(intent_name, payload)
         else:
             _print_april("I don't have anything to confirm.")
-    elif response_lower in {"no", "n", "cancel", "never mind", "nevermind"}:
+    elif response_lower in _CONFIRM_NO:
         if _pending_action:
             _pending_action = None  # Clear pending action
+            if VOICE_ENABLED:
+                interrupt()  # Drop any unspoken part of the confirmation prompt
             _print_april("Okay. I won't do that.")
         else:
             _print_april("I don't have anything to cancel.")
@@ -288,13 +339,11 @@ def _handle_confirmation_response(response: str) -> None:
             _print_april("I can't do that yet.")
 
 
-def _handle_suggestion_response(response: str) -> None:
-    """Handle yes/no suggestion responses."""
+def _handle_suggestion_response(response_lower: str) -> None:
+    """Handle yes/no suggestion responses, already stripped and lowercased."""
     global _suggested_action
     
-    response_lower = response.strip().lower()
-    
-    if response_lower in {"yes", "y", "ok", "okay", "sure"}:
+    if response_lower in _SUGGESTION_YES:
         if _suggested_action:
             intent_name = _suggested_action.get("intent_name")
             payload = _suggested_action.get("payload", {})
@@ -302,7 +351,7 @@ def _handle_suggestion_response(response: str) -> None:
             _execute_action(intent_name, payload)
         else:
             _print_april("I don't have anything to suggest.")
-    elif response_lower in {"no", "n", "not now", "nope"}:
+    elif response_lower in _SUGGESTION_NO:
         if _suggested_action:
             _suggested_action = None  # Clear suggestion
             _print_april("Alright.")
@@ -331,6 +380,10 @@ def _loop() -> None:
             print("WARNING: TTS not available. Voice output disabled.")
         elif not stt_ok:
             print("WARNING: STT not available. Voice input disabled.")
+        
+        if stt_ok:
+            # Capture and recognize on a background thread from here on
+            start_background_listening()
     
     _print_april("online. ready.")
 
@@ -339,8 +392,10 @@ def _loop() -> None:
         
         # Try voice input first if enabled
         if VOICE_ENABLED and is_stt_available():
+            flush()  # Keep APRIL's own speech out of the microphone
             print("You> 🎤 [Speak now...]", end="", flush=True)
-            voice_text = listen()
+            # A pending yes/no question only needs a one-word answer
+            voice_text = listen(short=_pending_action is not None or _suggested_action is not None)
             
             if voice_text:
                 command = voice_text
@@ -373,13 +428,21 @@ def _loop() -> None:
             continue
 
         lowered = command.lower()
-        if lowered in {"exit", "quit"}:
+        if lowered in _EXIT_COMMANDS:
             _print_april("shutting down.")
             break
 
-        # Detect social phrases (greetings, farewells, positive feedback, check-ins)
-        is_social, phrase_type = detect_social_phrase(command)
-        if is_social:
+        # One scan: social phrases (greetings, farewells, positive feedback,
+        # check-ins) take priority over gratitude
+        phrase_type = classify_social_phrase(lowered)
+        
+        # Detect gratitude and respond warmly
+        if phrase_type == "gratitude":
+            set_emotional_state("friendly")
+            _print_april_with_context("", "gratitude_response")
+            continue
+        
+        if phrase_type:
             if phrase_type == "greeting":
                 set_emotional_state("calm")
             elif phrase_type == "checkin":
@@ -391,24 +454,19 @@ def _loop() -> None:
             _print_april(response)
             continue
 
-        # Detect gratitude and respond warmly
-        if detect_gratitude(command):
-            set_emotional_state("friendly")
-            _print_april_with_context("", "gratitude_response")
-            continue
-
-        intent_name, payload = parse_intent(command)
-
         # Handle suggestion responses first (higher priority)
         if _suggested_action is not None:
-            _handle_suggestion_response(command)
+            _handle_suggestion_response(lowered)
             continue
 
         # Handle confirmation responses
         if _pending_action is not None:
-            _handle_confirmation_response(command)
+            _handle_confirmation_response(lowered)
             continue
 
+        # Only parse once no yes/no answer is pending
+        intent_name, payload = parse_intent(command)
+
         # No intent detected
         if not intent_name:
             _print_april("I can't do that yet.")
@@ -441,6 +499,10 @@ def main() -> None:
     except Exception as e:
         _print_april(f"critical fault: {e}. standing down.")
         sys.exit(1)
+    finally:
+        # Let queued speech finish before the daemon TTS worker exits with us
+        if VOICE_ENABLED:
+            flush()
 
 
 if __name__ == "__main__":
@@ -4,17 +4,19 @@ DAY 8 EXTENSION — PERSISTENT ACTION HISTORY
 Upgrade action history to persist across APRIL restarts.
 
 REQUIREMENTS:
-- Store action history in memory/action_history.json
-- Load history at module import
-- Save history after each action is recorded
-- Maintain rolling window (max 100 actions)
+- Store action history in memory/action_history.ndjson (one JSON string per line)
+- Load history at module import (older action_history.json lists are migrated)
+- Append recorded actions to the file from a background flusher (every 2s and at exit)
+- Maintain rolling window (max 100 actions); compact the file past twice that
 
 IMPLEMENT:
 - _load_history()
-- _save_history()
+- _append_actions(actions)
+- _save_history(entries)
+- _flush()
 - record_action(action_signature: str) -> None
-- get_history() -> list[str]
-- detect_pattern(last_action: str) -> str | None
+- get_history() -> tuple[str, ...] (shared read-only snapshot)
+- detect_pattern(last_action: str) -> str | None (O(1) via successor counts)
 
 RULES:
 - File path relative to this module
@@ -23,62 +25,193 @@ RULES:
 - Keep rolling window to prevent infinite growth
 """
 
+import atexit
 import json
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Optional: orjson encodes faster; the stdlib json module is the fallback
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+    orjson = None
 
 _MODULE_DIR = Path(__file__).parent
-_HISTORY_FILE = _MODULE_DIR / "action_history.json"
+_HISTORY_FILE = _MODULE_DIR / "action_history.ndjson"
+_LEGACY_HISTORY_FILE = _MODULE_DIR / "action_history.json"
 _MAX_HISTORY_SIZE = 100
 
-_action_history = []
+_action_history = deque(maxlen=_MAX_HISTORY_SIZE)
+_file_entries = 0  # Lines currently in _HISTORY_FILE
+_history_snapshot: Optional[Tuple[str, ...]] = None  # Rebuilt lazily after changes
+
+# Disk writes happen off the command loop: record_action() only queues
+_FLUSH_INTERVAL = 2.0  # Seconds between background flushes
+_pending = []
+_state_lock = threading.Lock()  # Guards _action_history and _pending across threads
+_write_lock = threading.Lock()  # One flush at a time (timer vs. atexit)
+_flusher = None
+
+# action -> Counter of the actions that directly followed it in the window
+_successor_counts: Dict[str, Counter] = defaultdict(Counter)
+
+
+def _count_successors() -> None:
+    """Rebuild the successor counts from the current window."""
+    _successor_counts.clear()
+    for action, next_action in zip(_action_history, islice(_action_history, 1, None)):
+        _successor_counts[action][next_action] += 1
 
 
 def _load_history():
-    """Load action history from JSON file."""
-    global _action_history
+    """Load action history from the NDJSON file, migrating the old JSON list."""
+    global _action_history, _file_entries, _history_snapshot
+    _history_snapshot = None
     try:
         if _HISTORY_FILE.exists():
+            loaded = []
+            damaged = False
             with open(_HISTORY_FILE, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        damaged = True  # Appending would glue onto this line
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        damaged = True  # Skip a torn or corrupt line, keep the rest
+                        continue
+                    if isinstance(entry, str):
+                        loaded.append(entry)
+            _file_entries = len(loaded)
+            _action_history = deque(loaded, maxlen=_MAX_HISTORY_SIZE)  # Keep only recent actions
+            if damaged:
+                _save_history()
+        elif _LEGACY_HISTORY_FILE.exists():
+            with open(_LEGACY_HISTORY_FILE, 'r', encoding='utf-8') as f:
                 loaded = json.load(f)
-                if isinstance(loaded, list):
-                    _action_history = loaded[-_MAX_HISTORY_SIZE:]  # Keep only recent actions
-                else:
-                    _action_history = []
+            if isinstance(loaded, list):
+                _action_history = deque(
+                    (entry for entry in loaded if isinstance(entry, str)), maxlen=_MAX_HISTORY_SIZE
+                )
+                _save_history()
+            else:
+                _action_history = deque(maxlen=_MAX_HISTORY_SIZE)
         else:
-            _action_history = []
+            _action_history = deque(maxlen=_MAX_HISTORY_SIZE)
+    except Exception:
+        _action_history = deque(maxlen=_MAX_HISTORY_SIZE)
+    _count_successors()
+
+
+def _encode_line(action: str) -> bytes:
+    """Serialize one action as an NDJSON line."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(action) + b"\n"
+    return (json.dumps(action) + "\n").encode('utf-8')
+
+
+def _append_actions(actions):
+    """Append a batch of actions to the history file in one write."""
+    global _file_entries
+    try:
+        _MODULE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_HISTORY_FILE, 'ab') as f:
+            f.write(b"".join(_encode_line(action) for action in actions))
+        _file_entries += len(actions)
     except Exception:
-        _action_history = []
+        pass
 
 
-def _save_history():
-    """Save current action history to JSON file."""
+def _save_history(entries=None):
+    """Rewrite the history file from entries (default: the current rolling window)."""
+    global _file_entries
+    if entries is None:
+        entries = tuple(_action_history)
     try:
         _MODULE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(_HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(_action_history, f, indent=2)
+        with open(_HISTORY_FILE, 'wb') as f:
+            f.writelines(_encode_line(entry) for entry in entries)
+        _file_entries = len(entries)
     except Exception:
         pass
 
 
+def _flush():
+    """Write queued actions to disk; compact the file once it grows past twice the window."""
+    global _pending
+    with _write_lock:
+        with _state_lock:
+            batch, _pending = _pending, []
+            if not batch:
+                return
+            window = None
+            if _file_entries + len(batch) > _MAX_HISTORY_SIZE * 2:
+                window = tuple(_action_history)
+        if window is not None:
+            _save_history(window)
+        else:
+            _append_actions(batch)
+
+
+def _flush_loop():
+    """Background flusher: write queued actions every _FLUSH_INTERVAL seconds."""
+    while True:
+        time.sleep(_FLUSH_INTERVAL)
+        try:
+            _flush()
+        except Exception:
+            pass
+
+
+def _start_flusher():
+    """Start the background flusher on first use."""
+    global _flusher
+    if _flusher is None:
+        _flusher = threading.Thread(target=_flush_loop, name="april-history", daemon=True)
+        _flusher.start()
+
+
 def record_action(action_signature: str) -> None:
-    """Record an executed action and persist to disk."""
+    """Record an executed action; the background flusher persists it to disk."""
+    global _history_snapshot
     if not isinstance(action_signature, str) or not action_signature.strip():
         return
     
-    global _action_history
-    _action_history.append(action_signature.strip())
+    action = action_signature.strip()
     
-    # Maintain rolling window
-    if len(_action_history) > _MAX_HISTORY_SIZE:
-        _action_history.pop(0)
+    with _state_lock:
+        # Appending to a full window evicts the oldest pair
+        if len(_action_history) == _MAX_HISTORY_SIZE:
+            oldest, successor = _action_history[0], _action_history[1]
+            counts = _successor_counts[oldest]
+            counts[successor] -= 1
+            if counts[successor] <= 0:
+                del counts[successor]
+                if not counts:
+                    del _successor_counts[oldest]
+        if _action_history:
+            _successor_counts[_action_history[-1]][action] += 1
+        
+        # The deque's maxlen maintains the rolling window
+        _action_history.append(action)
+        _history_snapshot = None
+        _pending.append(action)
     
-    _save_history()
+    _start_flusher()
 
 
-def get_history() -> list:
-    """Return current action history."""
-    return _action_history.copy()
+def get_history() -> Tuple[str, ...]:
+    """Return current action history as an immutable snapshot, shared until the next change."""
+    global _history_snapshot
+    if _history_snapshot is None:
+        _history_snapshot = tuple(_action_history)
+    return _history_snapshot
 
 
 def detect_pattern(last_action: str) -> Optional[str]:
@@ -87,21 +220,20 @@ def detect_pattern(last_action: str) -> Optional[str]:
         return None
     
     # Look for pattern: last_action → next_action
-    pattern_candidates = {}
-    
-    for i in range(len(_action_history) - 1):
-        if _action_history[i] == last_action:
-            next_action = _action_history[i + 1]
-            if next_action != last_action:  # Don't suggest same action
-                pattern_candidates[next_action] = pattern_candidates.get(next_action, 0) + 1
+    pattern_candidates = _successor_counts.get(last_action)
+    if not pattern_candidates:
+        return None
     
-    # If any pattern occurs 3+ times, suggest it
-    for action, count in pattern_candidates.items():
-        if count >= 3:
+    # Suggest the most frequent successor seen 3+ times
+    for action, count in pattern_candidates.most_common():
+        if count < 3:
+            break
+        if action != last_action:  # Don't suggest same action
             return action
     
     return None
 
 
-# Load history when module is imported
-_load_history()
\ No newline at end of file
+# Load history when module is imported; queued actions are written at exit too
+_load_history()
+atexit.register(_flush)
\ No newline at end of file
@@ -6,7 +6,8 @@ Upgrade the preference system to persist data across restarts.
 REQUIREMENTS:
 - Store preferences in a local JSON file (preferences.json)
 - Load preferences at module import
-- Save preferences every time set_preference is called
+- Save preferences every time set_preference changes a value
+- Write atomically (temp file + rename) so a crash never leaves half a file
 - If file does not exist, start with defaults
 
 DEFAULTS:
@@ -33,9 +34,18 @@ import json
 import os
 from pathlib import Path
 
+# Optional: orjson encodes faster; the stdlib json module is the fallback
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+    orjson = None
+
 # Get the directory where this module lives
 _MODULE_DIR = Path(__file__).parent
 _PREFERENCES_FILE = _MODULE_DIR / "preferences.json"
+_PREFERENCES_TMP_FILE = _PREFERENCES_FILE.with_suffix(".json.tmp")
 
 # Default preferences
 _DEFAULTS = {
@@ -46,6 +56,9 @@ _DEFAULTS = {
 # Active preferences storage
 _preferences = {}
 
+# Bumped on every change so callers can cache preference-dependent results
+_version = 0
+
 
 def _load_preferences():
     """Load preferences from JSON file, fall back to defaults if file missing or corrupt."""
@@ -65,23 +78,41 @@ def _load_preferences():
         _preferences = _DEFAULTS.copy()
 
 
+def _encode_preferences(data: dict) -> bytes:
+    """Serialize preferences as indented UTF-8 JSON."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
 def _save_preferences():
     """Save current preferences to JSON file, fail silently on errors."""
     try:
         # Ensure directory exists
         _MODULE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(_PREFERENCES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(_preferences, f, indent=2)
+        _PREFERENCES_TMP_FILE.write_bytes(_encode_preferences(_preferences))
+        # Readers see either the old file or the new one, never a partial write
+        os.replace(_PREFERENCES_TMP_FILE, _PREFERENCES_FILE)
     except Exception:
         # Fail silently - preference changes will be lost on restart but won't crash
         pass
 
 
+def preferences_version() -> int:
+    """Return a counter that changes whenever a preference is updated."""
+    return _version
+
+
 def get_preference(key: str) -> str:
     """Return the configured preference for a category."""
     if not isinstance(key, str):
         return ""
     
+    # Callers usually pass an already-normalized key; skip the string copies
+    value = _preferences.get(key)
+    if value is not None:
+        return value
+    
     normalized_key = key.strip().lower()
     if not normalized_key:
         return ""
@@ -91,6 +122,7 @@ def get_preference(key: str) -> str:
 
 def set_preference(key: str, value: str) -> None:
     """Update a preference value and persist to disk immediately."""
+    global _version
     if not isinstance(key, str) or not isinstance(value, str):
         return
     
@@ -99,7 +131,11 @@ def set_preference(key: str, value: str) -> None:
     if not normalized_key or not normalized_value:
         return
     
+    if _preferences.get(normalized_key) == normalized_value:
+        return  # Unchanged: no write, and cached results stay valid
+    
     _preferences[normalized_key] = normalized_value
+    _version += 1
     _save_preferences()
 
 
@@ -63,14 +63,14 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
-from typing import Optional, Sequence, TypedDict
+from typing import Optional, TypedDict
 
 
 class AppEntry(TypedDict):
 	"""Approved application definition."""
 
 	label: str
-	candidates: Sequence[str]
+	candidates: tuple[str, ...]
 
 
 _ALLOWED_APPS: dict[str, AppEntry] = {
@@ -118,21 +118,44 @@ _ALLOWED_APPS: dict[str, AppEntry] = {
 }
 
 
+# Detached launch options, fixed per platform. start_new_session is POSIX-only;
+# on Windows the app gets its own process group and no console, so Ctrl+C in
+# APRIL's console never reaches it. close_fds stays at its default so APRIL's
+# handles are not inherited.
+if os.name == "nt":
+	_LAUNCH_OPTIONS: dict = {
+		"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS,
+	}
+else:
+	_LAUNCH_OPTIONS = {"start_new_session": True}
+
+
 def _expand_environment(path: str) -> str:
 	"""Expand environment variables in whitelisted paths."""
 	return os.path.expandvars(path)
 
 
-def _resolve_executable(options: Sequence[str]) -> Optional[str]:
+# Resolved executables per candidate tuple. Only hits are kept, so an app
+# installed (or added to PATH) mid-session is found on the next open.
+_resolved: dict[tuple[str, ...], str] = {}
+
+
+def _resolve_executable(options: tuple[str, ...]) -> Optional[str]:
 	"""Return first existing executable path from the approved list."""
+	cached = _resolved.get(options)
+	if cached:
+		return cached
+
 	for option in options:
 		expanded = _expand_environment(option)
 		if os.path.isabs(expanded):
 			if os.path.exists(expanded):
+				_resolved[options] = expanded
 				return expanded
 		else:
 			resolved = shutil.which(expanded)
 			if resolved:
+				_resolved[options] = resolved
 				return resolved
 	return None
 
@@ -159,8 +182,10 @@ def open_application(app_name: str, category: str = "") -> str:
 		return "I couldn't find that application."
 
 	try:
-		subprocess.Popen([executable], start_new_session=True)
+		subprocess.Popen([executable], **_LAUNCH_OPTIONS)
 	except FileNotFoundError:
+		# The cached path went away; resolve from disk again next time
+		_resolved.pop(app_entry["candidates"], None)
 		if category:
 			return f"I can't find your {category}."
 		return "I couldn't find that application."
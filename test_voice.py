@@ -4,44 +4,58 @@ Run this to verify TTS and STT work independently.
 """
 
 import sys
+import threading
+from functools import lru_cache
 from core.voice import (
-    speak,
-    listen,
-    is_tts_available,
-    is_stt_available,
+    speak_async,
+    flush,
+    listen_stream,
+    calibrate,
+    get_recognizer,
+    warm_up_stt,
     get_voice_status,
 )
 
+_RULE = "=" * 50
+
+# Drawn once per run; built here so main() writes it in one call
+_BAR = "═" * 48
+_PAD = " " * 48
+_TITLE = "    APRIL VOICE MODULE TEST SUITE".center(48)
+_BANNER = f"\n\n╔{_BAR}╗\n║{_PAD}║\n║{_TITLE}║\n║{_PAD}║\n╚{_BAR}╝\n\n\n"
+
+
+@lru_cache(maxsize=None)
+def _cached_status() -> dict:
+    """Probe voice capabilities once; availability can't change mid-run."""
+    return get_voice_status()
+
 
 def test_voice_status():
     """Check if voice capabilities are available."""
-    print("=" * 50)
-    print("VOICE MODULE STATUS CHECK")
-    print("=" * 50)
+    status = _cached_status()
     
-    status = get_voice_status()
-    
-    print(f"TTS Available: {status['tts_available']}")
-    print(f"STT Available: {status['stt_available']}")
-    print(f"Voice Ready: {status['voice_ready']}")
-    print()
+    report = (
+        f"{_RULE}\nVOICE MODULE STATUS CHECK\n{_RULE}\n"
+        f"TTS Available: {status['tts_available']}\n"
+        f"STT Available: {status['stt_available']}\n"
+        f"Voice Ready: {status['voice_ready']}\n\n"
+    )
     
     if not status['tts_available']:
-        print("⚠️  Text-to-Speech not available.")
-        print("   Install: pip install pyttsx3")
-        print()
+        report += "⚠️  Text-to-Speech not available.\n   Install: pip install pyttsx3\n\n"
     
     if not status['stt_available']:
-        print("⚠️  Speech-to-Text not available.")
-        print("   Install: pip install SpeechRecognition PyAudio")
-        print()
+        report += "⚠️  Speech-to-Text not available.\n   Install: pip install SpeechRecognition PyAudio\n\n"
     
+    sys.stdout.write(report)
+    sys.stdout.flush()
     return status['voice_ready']
 
 
 def test_tts():
     """Test text-to-speech."""
-    if not is_tts_available():
+    if not _cached_status()['tts_available']:
         print("❌ TTS not available. Skipping TTS test.")
         return False
     
@@ -55,10 +69,14 @@ def test_tts():
         "If you can hear this, TTS is working correctly.",
     ]
     
+    # Queue every phrase up front; the TTS worker speaks them back to back,
+    # the same path main.py uses for multi-sentence replies
     for i, msg in enumerate(test_messages, 1):
-        print(f"{i}. Speaking: {msg}")
-        speak(msg)
-        print("   ✓ Spoken")
+        print(f"{i}. Queued: {msg}")
+        speak_async(msg)
+    
+    flush()
+    print("   ✓ All spoken")
     
     print("\n✅ TTS test complete!")
     return True
@@ -66,7 +84,7 @@ def test_tts():
 
 def test_stt():
     """Test speech-to-text."""
-    if not is_stt_available():
+    if not _cached_status()['stt_available']:
         print("❌ STT not available. Skipping STT test.")
         return False
     
@@ -80,11 +98,22 @@ def test_stt():
     print("3. The text you spoke will be displayed")
     print()
     
+    # Calibrate once up front so no attempt waits on it
+    print("Calibrating for background noise, please stay quiet...")
+    if calibrate():
+        print(f"   Energy threshold: {get_recognizer().energy_threshold:.0f}")
+    
     for attempt in range(3):
-        print(f"\nAttempt {attempt + 1}/3:")
-        print("[Listening...]")
+        # One write, so the console is idle once the microphone is live
+        sys.stdout.write(f"\nAttempt {attempt + 1}/3:\n[Listening...]\n")
+        sys.stdout.flush()
         
-        result = listen()
+        result = None
+        for text, is_final in listen_stream():
+            if is_final:
+                result = text
+                break
+            print(f"  … {text}", end="\r", flush=True)
         
         if result:
             print(f"✓ Heard: {result}")
@@ -103,13 +132,14 @@ def test_stt():
 
 def main():
     """Run all voice tests."""
-    print("\n")
-    print("╔" + "═" * 48 + "╗")
-    print("║" + " " * 48 + "║")
-    print("║" + "    APRIL VOICE MODULE TEST SUITE".center(48) + "║")
-    print("║" + " " * 48 + "║")
-    print("╚" + "═" * 48 + "╝")
-    print("\n")
+    status = _cached_status()
+    if not status['tts_available'] and not status['stt_available']:
+        # Nothing to test; just show the install hints
+        test_voice_status()
+        return
+    
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
     
     # Check status
     voice_ready = test_voice_status()
@@ -119,6 +149,11 @@ def main():
         print("    See installation instructions above.")
         return
     
+    # The TTS engine is already up (status check); get STT ready while
+    # the prompts below wait for the user and the TTS test plays
+    stt_warmup = threading.Thread(target=warm_up_stt, name="stt-warmup", daemon=True)
+    stt_warmup.start()
+    
     print("\n✅ Voice module is ready!")
     print("\nPress Enter to start tests (or Ctrl+C to cancel)...")
     try:
@@ -135,6 +170,7 @@ def main():
     print("\n")
     response = input("\nTest speech-to-text? (y/n): ").strip().lower()
     if response == 'y':
+        stt_warmup.join()
         test_stt()
     else:
         print("STT test skipped.")